@@ -5,11 +5,27 @@ Uses official hcloud library for Cloud API and hetzner library for Robot API.
 """
 
 import os
+import re
+import random
 import sys
-import json
+import time
+import atexit
+import hashlib
 import logging
+import functools
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, List, Any, Optional
+from typing import Callable, Dict, List, Any, Optional
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.auth import HTTPBasicAuth
+from urllib3.util.retry import Retry
+
+from utils.json_io import parse_json, write_json
 
 # Official Hetzner libraries
 try:
@@ -41,13 +57,340 @@ class HetznerConfig:
         # Feature flags
         self.enable_cloud = os.environ.get("HETZNER_ENABLE_CLOUD", "true").lower() == "true"
         self.enable_dedicated = os.environ.get("HETZNER_ENABLE_DEDICATED", "false").lower() == "true"
+        
+        # Seconds a fetched pricing payload is reused (prices change rarely)
+        self.cache_duration = int(os.environ.get("HETZNER_CACHE_DURATION", "3600"))
+        # Optional directory where API responses persist between runs (disabled when empty)
+        self.cache_dir = os.environ.get("HETZNER_CACHE_DIR", "")
+        
+        # Credentials are fixed for the process, so request auth is built once and reused
+        self.cloud_api_headers = {'Authorization': f'Bearer {self.cloud_api_token}'}
+        self.robot_auth = HTTPBasicAuth(self.robot_user, self.robot_password)
 
 config = HetznerConfig()
 
+# API endpoints
+HETZNER_CLOUD_API_URL = "https://api.hetzner.cloud/v1"
+HETZNER_ROBOT_API_URL = "https://robot-ws.your-server.de"
+API_TIMEOUT = 30
+API_RETRY_COUNT = 3
+API_RETRY_BACKOFF = 0.5  # Seconds; retry n waits a random 0..API_RETRY_BACKOFF * 2**(n-1)
+MAX_FETCH_WORKERS = 4  # Concurrent API fetches per collector
+API_CACHE_MAXSIZE = 32  # Distinct API responses kept in memory
+API_RATE_LIMIT_FLOOR = 2  # Pause when this few requests remain in the rate-limit window
+API_RATE_LIMIT_MAX_WAIT = 5.0  # Seconds; the Cloud API refills about one request per second
+API_CIRCUIT_THRESHOLD = 2  # Consecutive failed requests (each already retried) before a host is skipped
+API_CIRCUIT_COOLDOWN = 60.0  # Seconds a failing host is skipped before it is tried again
+
+class _JitteredRetry(Retry):
+    """urllib3 Retry with full-jitter exponential backoff on every attempt.
+    
+    Stock Retry waits 0s before the first retry, so concurrent collectors would all
+    retry at once; here retry n waits uniform(0, backoff_factor * 2**(n-1)) instead.
+    """
+    
+    def get_backoff_time(self) -> float:
+        # Count only the trailing run of errors, ignoring redirects, as urllib3 does
+        consecutive_errors = 0
+        for attempt in reversed(self.history):
+            if attempt.redirect_location is not None:
+                break
+            consecutive_errors += 1
+        if consecutive_errors == 0:
+            return 0.0
+        cap = min(self.backoff_max, self.backoff_factor * (2 ** (consecutive_errors - 1)))
+        return random.uniform(0, cap)
+
+# Shared HTTP session so Cloud and Robot API calls reuse pooled keep-alive connections
+_SESSION = requests.Session()
+# Rate limits (429) and transient server errors are retried by urllib3 with jittered
+# exponential backoff, honouring Retry-After; the final response is returned so callers
+# see the status
+_RETRY = _JitteredRetry(
+    total=API_RETRY_COUNT,
+    backoff_factor=API_RETRY_BACKOFF,
+    status_forcelist=(429, 500, 502, 503, 504),
+    allowed_methods=frozenset(['GET']),
+    respect_retry_after_header=True,
+    raise_on_status=False
+)
+_SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=_RETRY))
+# requests already negotiates gzip/deflate (br once brotli is installed) and keep-alive
+_SESSION.headers.update({'Accept': 'application/json'})
+atexit.register(_SESSION.close)
+
 # Set up logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Precompiled spec patterns for dedicated server descriptions
+# Unit case is spelled out in character classes rather than re.IGNORECASE, which
+# would case-fold every character the engine compares
+_STORAGE_DESC_RE = re.compile(r'(\d+)x?\s*(\d+(?:\.\d+)?)\s*([TtGg][Bb])')
+# Tried in order, first match wins; variants the earlier patterns subsume are dropped.
+# Order matters: any "c/" hit beats any "c " hit, and "GB" beats "gb"
+_CPU_CORE_PATTERNS = (
+    re.compile(r'(\d+)\s*cores?'),
+    re.compile(r'(\d+)c/'),
+    re.compile(r'(\d+)c\s'),
+)
+_RAM_PATTERNS = (
+    re.compile(r'(\d+)\s*GB'),
+    re.compile(r'(\d+)\s*gb'),
+)
+# (literal, pattern, GB multiplier) triples, matched against lowercased storage text;
+# the unit literal is checked first with a cheap `in` since the pattern cannot match without it
+_STORAGE_SIZE_PATTERNS = (
+    ('tb', re.compile(r'(\d+)\s*tb'), 1000),
+    ('gb', re.compile(r'(\d+)\s*gb'), 1),
+)
+# Robot datacenter code prefixes and their cities, checked in order
+_DATACENTER_CITIES = (
+    ('FSN1', 'Falkenstein'),
+    ('NBG1', 'Nuremberg'),
+    ('HEL1', 'Helsinki'),
+    ('ASH', 'Ashburn'),
+    ('HIL', 'Hildesheim'),
+)
+# Disk type keyword table, checked in order against lowercased storage text
+_DISK_TYPE_KEYWORDS = (
+    ('nvme', 'NVMe SSD'),
+    ('ssd', 'SSD'),
+    ('hdd', 'HDD'),
+    ('sata', 'HDD'),
+)
+
+# Shared read-only default for missing nested price fields (avoids a new {} per lookup)
+_EMPTY: Dict[str, Any] = {}
+
+# Bounded LRU of API responses: key -> (data, time.monotonic() deadline)
+_api_cache: "OrderedDict[tuple, tuple]" = OrderedDict()
+_api_cache_lock = threading.Lock()
+_fetch_locks: Dict[tuple, threading.Lock] = {}
+
+def clear_api_cache() -> None:
+    """Drop all cached API responses."""
+    with _api_cache_lock:
+        _api_cache.clear()
+
+def _cache_get(key: tuple) -> Optional[tuple]:
+    """Return the live (data, deadline) entry for key, or None."""
+    with _api_cache_lock:
+        entry = _api_cache.get(key)
+        if entry is None:
+            return None
+        if entry[1] <= time.monotonic():
+            del _api_cache[key]
+            return None
+        _api_cache.move_to_end(key)
+        return entry
+
+def _cache_set(key: tuple, data: Any, ttl: Optional[float] = None) -> None:
+    """Store data under key for ttl seconds (default cache_duration), evicting expired
+    and then least recently used entries."""
+    with _api_cache_lock:
+        now = time.monotonic()
+        # Expired payloads are only dropped lazily on read, so purge them here rather
+        # than letting dead entries hold memory and LRU slots in long-lived processes
+        for stale_key in [k for k, (_, deadline) in _api_cache.items() if deadline <= now]:
+            del _api_cache[stale_key]
+        _api_cache[key] = (data, now + (config.cache_duration if ttl is None else ttl))
+        _api_cache.move_to_end(key)
+        while len(_api_cache) > API_CACHE_MAXSIZE:
+            _api_cache.popitem(last=False)
+
+def _disk_cache_path(key: tuple) -> str:
+    """Return the file holding the persisted response for key."""
+    return os.path.join(config.cache_dir, hashlib.sha256(repr(key).encode()).hexdigest() + '.json')
+
+def _disk_cache_get(key: tuple) -> Optional[tuple]:
+    """Load a persisted response for key as (data, remaining seconds) if disk caching is on
+    and it is still fresh, or None."""
+    if not config.cache_dir:
+        return None
+    path = _disk_cache_path(key)
+    try:
+        # File mtime is wall-clock, so freshness survives process restarts
+        remaining = config.cache_duration - (time.time() - os.path.getmtime(path))
+        if remaining <= 0:
+            return None
+        with open(path, 'rb') as f:
+            return parse_json(f.read()), remaining
+    except (OSError, ValueError):
+        return None
+
+def _disk_cache_set(key: tuple, content: bytes) -> None:
+    """Persist the raw response body for key when disk caching is on."""
+    if not config.cache_dir:
+        return
+    path = _disk_cache_path(key)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(config.cache_dir, exist_ok=True)
+        with open(tmp_path, 'wb') as f:
+            f.write(content)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        logger.warning(f"Could not write API cache file {path}: {e}")
+
+# Per-host wall-clock times (RateLimit-Reset is a UNIX timestamp) before which requests should wait
+_rate_limit_until: Dict[str, float] = {}
+_rate_limit_lock = threading.Lock()
+
+def _rate_limit_delay(host: str) -> float:
+    """Return how long to wait before the next request to host, capped at API_RATE_LIMIT_MAX_WAIT."""
+    return min(_rate_limit_until.get(host, 0.0) - time.time(), API_RATE_LIMIT_MAX_WAIT)
+
+def _note_rate_limit(host: str, response: requests.Response) -> None:
+    """Record when to resume if host reports its rate-limit window is nearly spent."""
+    remaining = response.headers.get('RateLimit-Remaining')
+    reset = response.headers.get('RateLimit-Reset')
+    if remaining is None or reset is None:
+        return
+    try:
+        if int(remaining) > API_RATE_LIMIT_FLOOR:
+            return
+        reset_at = float(reset)
+    except ValueError:
+        return
+    with _rate_limit_lock:
+        _rate_limit_until[host] = max(_rate_limit_until.get(host, 0.0), reset_at)
+
+# Per-host circuit breaker: consecutive failure counts and time.monotonic() reopen times
+_host_failures: Dict[str, int] = {}
+_host_open_until: Dict[str, float] = {}
+_circuit_lock = threading.Lock()
+
+def _circuit_allows(host: str) -> bool:
+    """Return False while host is in its cooldown after repeated failures."""
+    return _host_open_until.get(host, 0.0) <= time.monotonic()
+
+def _circuit_record(host: str, failed: bool) -> None:
+    """Track consecutive outage-type failures for host, opening the circuit at the threshold."""
+    with _circuit_lock:
+        if not failed:
+            _host_failures.pop(host, None)
+            return
+        failures = _host_failures.get(host, 0) + 1
+        _host_failures[host] = failures
+        if failures >= API_CIRCUIT_THRESHOLD:
+            _host_open_until[host] = time.monotonic() + API_CIRCUIT_COOLDOWN
+            logger.warning(f"{host} failed {failures} times in a row, skipping it for {API_CIRCUIT_COOLDOWN:.0f}s")
+
+def fetch_json(url: str, headers: Optional[Dict[str, str]] = None, auth: Optional[HTTPBasicAuth] = None,
+               params: Optional[Dict[str, Any]] = None,
+               transform: Optional[Callable[[Any], Any]] = None) -> Any:
+    """GET a JSON API endpoint through the shared session, reusing cached responses.
+    
+    If given, transform is applied to the decoded body before it is cached in memory,
+    so every caller of that URL must pass the same one.
+    Raises requests.RequestException on transport errors and non-2xx responses.
+    """
+    key = (url, auth.username if auth else None, tuple(sorted(params.items())) if params else ())
+    
+    # Read-mostly fast path: a single dict read is atomic, so live hits take no
+    # lock (recency is only refreshed on the locked path, which is fine here)
+    entry = _api_cache.get(key)
+    if entry is not None and entry[1] > time.monotonic():
+        return entry[0]
+    
+    with _api_cache_lock:
+        fetch_lock = _fetch_locks.setdefault(key, threading.Lock())
+    
+    # Concurrent callers of the same endpoint wait for a single in-flight request,
+    # then re-check the cache in case it was filled while waiting
+    with fetch_lock:
+        entry = _cache_get(key)
+        if entry is not None:
+            return entry[0]
+        
+        disk_entry = _disk_cache_get(key)
+        if disk_entry is not None:
+            data, remaining = disk_entry
+            if transform is not None:
+                data = transform(data)
+            # Expire with the file rather than granting a fresh TTL
+            _cache_set(key, data, ttl=remaining)
+            return data
+        
+        host = urlsplit(url).netloc
+        
+        # Fail fast while the host is known to be down instead of waiting out every retry
+        # (checked before the rate-limit pause so a skipped request never sleeps)
+        if not _circuit_allows(host):
+            raise requests.ConnectionError(f"Skipping {url}: {host} is failing, circuit open")
+        
+        # Back off before the server has to answer 429; other hosts are unaffected
+        delay = _rate_limit_delay(host)
+        if delay > 0:
+            logger.info(f"{host} rate limit nearly exhausted, waiting {delay:.1f}s")
+            time.sleep(delay)
+        
+        logger.debug(f"Requesting {url}")
+        try:
+            response = _SESSION.get(url, headers=headers, auth=auth, params=params, timeout=API_TIMEOUT)
+        except (requests.ConnectionError, requests.Timeout):
+            _circuit_record(host, failed=True)
+            raise
+        # Only outages count against the host; 4xx means the request itself was rejected
+        _circuit_record(host, failed=response.status_code >= 500)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"{url}: HTTP {response.status_code}, Content-Encoding "
+                         f"{response.headers.get('Content-Encoding', 'identity')}, {len(response.content)} bytes")
+        _note_rate_limit(host, response)
+        response.raise_for_status()
+        data = parse_json(response.content)
+        if transform is not None:
+            data = transform(data)
+        _cache_set(key, data)
+        _disk_cache_set(key, response.content)
+        return data
+
+def _net(price: Dict[str, Any], field: str) -> float:
+    """Read the net amount of a price field such as 'price_hourly', treating a missing field as 0."""
+    return float((price.get(field) or _EMPTY).get('net', 0))
+
+def _slim_price(price: Dict[str, Any]) -> Dict[str, Any]:
+    """Keep only the per-location price fields the collectors read."""
+    return {
+        'location': price.get('location'),
+        'price_hourly': {'net': (price.get('price_hourly') or _EMPTY).get('net', 0)},
+        'price_monthly': {'net': (price.get('price_monthly') or _EMPTY).get('net', 0)},
+        'included_traffic': price.get('included_traffic', 0),
+        'price_per_tb_traffic': {'net': (price.get('price_per_tb_traffic') or _EMPTY).get('net', 0)}
+    }
+
+def _slim_pricing(pricing_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Reduce the /pricing response to the resource types and fields we consume before caching."""
+    pricing = pricing_data.get('pricing', {})
+    return {'pricing': {
+        key: [
+            {'name': entry.get('name'), 'prices': [_slim_price(p) for p in entry.get('prices', ())]}
+            for entry in pricing.get(key, ())
+        ]
+        for key in ('server_types', 'load_balancer_types')
+    }}
+
+def fetch_pricing_data() -> Optional[Dict[str, Any]]:
+    """Get Cloud API pricing, shared by all collectors instead of re-fetching."""
+    try:
+        return fetch_json(
+            f"{HETZNER_CLOUD_API_URL}/pricing",
+            headers=config.cloud_api_headers,
+            transform=_slim_pricing
+        )
+    except requests.RequestException as e:
+        logger.error(f"Failed to fetch pricing data: {e}")
+        return None
+
+def _build_price_index(pricing_data: Dict[str, Any]) -> Dict[str, Dict[str, Dict[str, Any]]]:
+    """Index Cloud API pricing entries by name for each priced resource type."""
+    pricing = pricing_data.get('pricing', {})
+    return {
+        key: {entry.get('name'): entry for entry in pricing.get(key, ())}
+        for key in ('server_types', 'load_balancer_types')
+    }
+
 class HetznerCloudCollector:
     """Collector for Hetzner Cloud services using official hcloud library."""
     
@@ -59,6 +402,13 @@ class HetznerCloudCollector:
             raise ValueError("HETZNER_API_TOKEN not provided")
             
         self.client = HCloudClient(token=config.cloud_api_token) 
+        
+        # Location mapping and price index are built once and shared by the concurrent collectors
+        self._location_map: Optional[Dict[str, Dict[str, str]]] = None
+        self._location_lock = threading.Lock()
+        self._price_index: Optional[Dict[str, Dict[str, Dict[str, Any]]]] = None
+        self._price_index_lock = threading.Lock()
+        self._location_details: Dict[str, Dict[str, str]] = {}
     
     def collect_all_cloud_services(self) -> List[Dict[str, Any]]:
         """Collect all cloud services data using official library."""
@@ -67,17 +417,20 @@ class HetznerCloudCollector:
         all_services = []
         
         try:
-            # Get server types with pricing
-            server_types = self._collect_server_types()
-            all_services.extend(server_types)
-            
-            # Get load balancer types with pricing
-            lb_types = self._collect_load_balancer_types()
-            all_services.extend(lb_types)
-            
-            # Get other pricing services
-            other_services = self._collect_other_services()
-            all_services.extend(other_services)
+            # The collectors hit independent endpoints, so fetch them concurrently
+            with ThreadPoolExecutor(max_workers=MAX_FETCH_WORKERS) as executor:
+                # Warm the shared price index and location map alongside the type listings;
+                # collectors block on the same locks until these are ready
+                executor.submit(self._get_price_index)
+                executor.submit(self._get_shared_location_map)
+                
+                server_types = executor.submit(self._collect_server_types)
+                lb_types = executor.submit(self._collect_load_balancer_types)
+                other_services = executor.submit(self._collect_other_services)
+                
+                # Gather in a fixed order so output ordering stays stable; each collector
+                # handles its own errors, so the list is built in one go
+                all_services = [*server_types.result(), *lb_types.result(), *other_services.result()]
             
             logger.info(f"✅ Cloud services: {len(all_services)} items")
             
@@ -93,63 +446,47 @@ class HetznerCloudCollector:
         try:
             # Get server types from hcloud library
             server_types = self.client.server_types.get_all()
-            locations = self.client.locations.get_all()
             
             # Get pricing data via direct API call (since hcloud doesn't include pricing by default)
-            import requests
-            headers = {
-                'Authorization': f'Bearer {config.cloud_api_token}',
-                'Content-Type': 'application/json'
-            }
-            
-            logger.info("Fetching pricing data via direct API...")
-            pricing_response = requests.get("https://api.hetzner.cloud/v1/pricing", headers=headers)
-            if pricing_response.status_code != 200:
-                logger.error(f"Failed to fetch pricing data: {pricing_response.status_code}")
+            price_index = self._get_price_index()
+            if price_index is None:
                 return []
             
-            pricing_data = pricing_response.json()
-            pricing_by_type = {}
-            
-            if 'pricing' in pricing_data:
-                for pricing_entry in pricing_data['pricing'].get('server_types', []):
-                    pricing_by_type[pricing_entry.get('name')] = pricing_entry
+            pricing_by_type = price_index['server_types']
             
             # Create location mapping
-            location_map = self._get_location_mapping(locations)
+            location_map = self._get_shared_location_map()
             
             processed_servers = []
             
+            # Per-run constants, computed once rather than per server type
+            last_updated = datetime.now().isoformat()
+            ipv4_primary_ip_cost = 0.50  # Standard IPv4 Primary IP cost from Hetzner (approximate)
+            ipv4_primary_ip_hourly = ipv4_primary_ip_cost / 730.44
+            
             for server_type in server_types:
                 try:
                     # Get pricing for this server type
-                    pricing_info = pricing_by_type.get(server_type.name, {})
+                    type_name = server_type.name
+                    pricing_info = pricing_by_type.get(type_name, _EMPTY)
                     
                     if 'prices' not in pricing_info:
-                        logger.warning(f"No pricing found for server type: {server_type.name}")
+                        logger.warning(f"No pricing found for server type: {type_name}")
                         continue
                     
-                    # Process regional pricing
-                    regional_pricing = []
-                    locations_list = []
-                    
-                    for price_entry in pricing_info['prices']:
-                        location_code = price_entry.get('location')
-                        if location_code:
-                            locations_list.append(location_code)
-                            
-                            hourly_net = float(price_entry.get('price_hourly', {}).get('net', 0))
-                            monthly_net = float(price_entry.get('price_monthly', {}).get('net', 0))
-                            included_traffic = price_entry.get('included_traffic', 0)
-                            traffic_price = float(price_entry.get('price_per_tb_traffic', {}).get('net', 0))
-                            
-                            regional_pricing.append({
-                                'location': location_code,
-                                'hourly_net': hourly_net,
-                                'monthly_net': monthly_net,
-                                'included_traffic': included_traffic,
-                                'traffic_price_per_tb': traffic_price
-                            })
+                    # Process regional pricing (entries without a location are skipped)
+                    regional_pricing = [
+                        {
+                            'location': price_entry['location'],
+                            'hourly_net': _net(price_entry, 'price_hourly'),
+                            'monthly_net': _net(price_entry, 'price_monthly'),
+                            'included_traffic': price_entry.get('included_traffic', 0),
+                            'traffic_price_per_tb': _net(price_entry, 'price_per_tb_traffic')
+                        }
+                        for price_entry in pricing_info['prices']
+                        if price_entry.get('location')
+                    ]
+                    locations_list = [p['location'] for p in regional_pricing]
                     
                     # Calculate price ranges
                     if regional_pricing:
@@ -167,20 +504,8 @@ class HetznerCloudCollector:
                     else:
                         continue
                     
-                    # Get IPv4 Primary IP cost (approximate)
-                    ipv4_primary_ip_cost = 0.50  # Standard cost from Hetzner
-                    
                     # Process location details
-                    location_details = []
-                    for location_code in locations_list:
-                        location_info = location_map.get(location_code, {})
-                        location_details.append({
-                            'code': location_code,
-                            'city': location_info.get('city', location_code),
-                            'country': location_info.get('country', 'Unknown'),
-                            'countryCode': location_info.get('countryCode', 'XX'),
-                            'region': location_info.get('region', 'Unknown')
-                        })
+                    location_details = self._get_location_details(location_map, locations_list)
                     
                     # Calculate pricing for both network options
                     # Base price from API is actually IPv6-only pricing
@@ -189,13 +514,13 @@ class HetznerCloudCollector:
                     
                     # IPv4+IPv6 pricing includes IPv4 Primary IP cost
                     ipv4_ipv6_monthly = monthly_price + ipv4_primary_ip_cost  # €3.29 + €0.50 = €3.79
-                    ipv4_ipv6_hourly = hourly_price + (ipv4_primary_ip_cost / 730.44)
+                    ipv4_ipv6_hourly = hourly_price + ipv4_primary_ip_hourly
                     
                     # Create server entry with pricing options
                     server_data = {
                         'platform': 'cloud',
                         'type': 'cloud-server',
-                        'instanceType': getattr(server_type, 'name', ''),
+                        'instanceType': type_name,
                         'vCPU': getattr(server_type, 'cores', 0),
                         'memoryGiB': getattr(server_type, 'memory', 0),
                         'diskType': getattr(server_type, 'storage_type', ''),
@@ -207,7 +532,7 @@ class HetznerCloudCollector:
                         'deprecated': getattr(server_type, 'deprecated', False),
                         'source': 'hetzner_cloud_api',
                         'description': getattr(server_type, 'description', ''),
-                        'lastUpdated': datetime.now().isoformat(),
+                        'lastUpdated': last_updated,
                         
                         # Pricing display (IPv4+IPv6 pricing for accurate comparison)
                         'priceEUR_hourly_net': ipv4_ipv6_hourly,
@@ -237,8 +562,8 @@ class HetznerCloudCollector:
                                 'description': 'IPv4 + IPv6 included',
                                 'priceRange': {
                                     'hourly': {
-                                        'min': min_hourly + (ipv4_primary_ip_cost / 730.44),
-                                        'max': max_hourly + (ipv4_primary_ip_cost / 730.44)
+                                        'min': min_hourly + ipv4_primary_ip_hourly,
+                                        'max': max_hourly + ipv4_primary_ip_hourly
                                     },
                                     'monthly': {
                                         'min': min_monthly + ipv4_primary_ip_cost,
@@ -296,49 +621,39 @@ class HetznerCloudCollector:
         try:
             # Get LB types from hcloud library
             lb_types = self.client.load_balancer_types.get_all()
-            locations = self.client.locations.get_all()
-            
-            # Get pricing data via direct API call
-            import requests
-            headers = {
-                'Authorization': f'Bearer {config.cloud_api_token}',
-                'Content-Type': 'application/json'
-            }
             
-            pricing_response = requests.get("https://api.hetzner.cloud/v1/pricing", headers=headers)
-            if pricing_response.status_code != 200:
-                logger.error(f"Failed to fetch pricing data: {pricing_response.status_code}")
+            # Get pricing data (shared with the server type collector)
+            price_index = self._get_price_index()
+            if price_index is None:
                 return []
             
-            pricing_data = pricing_response.json()
-            pricing_by_type = {}
-            
-            if 'pricing' in pricing_data:
-                for pricing_entry in pricing_data['pricing'].get('load_balancer_types', []):
-                    pricing_by_type[pricing_entry.get('name')] = pricing_entry
+            pricing_by_type = price_index['load_balancer_types']
             
             # Create location mapping for flags
-            location_map = self._get_location_mapping(locations)
+            location_map = self._get_shared_location_map()
             
             processed_lbs = []
+            last_updated = datetime.now().isoformat()
             
             for lb_type in lb_types:
                 try:
                     # Get pricing for this LB type
-                    pricing_info = pricing_by_type.get(lb_type.name, {})
+                    type_name = lb_type.name
+                    pricing_info = pricing_by_type.get(type_name, _EMPTY)
                     
                     if 'prices' not in pricing_info:
-                        logger.warning(f"No pricing found for load balancer type: {lb_type.name}")
+                        logger.warning(f"No pricing found for load balancer type: {type_name}")
                         continue
                     
                     # Process pricing (usually same across regions for LBs)
-                    if pricing_info['prices']:
-                        price = pricing_info['prices'][0]  # Take first price
-                        hourly_price = float(price.get('price_hourly', {}).get('net', 0))
-                        monthly_price = float(price.get('price_monthly', {}).get('net', 0))
+                    prices = pricing_info['prices']
+                    if prices:
+                        price = prices[0]  # Take first price
+                        hourly_price = _net(price, 'price_hourly')
+                        monthly_price = _net(price, 'price_monthly')
                         
                         # Get all locations
-                        locations_list = [p.get('location') for p in pricing_info['prices'] if p.get('location')]
+                        locations_list = [p['location'] for p in prices if p.get('location')]
                         
                         if hourly_price == 0 and monthly_price == 0:
                             continue
@@ -346,21 +661,12 @@ class HetznerCloudCollector:
                         continue
                     
                     # Process location details for flags
-                    location_details = []
-                    for location_code in locations_list:
-                        location_info = location_map.get(location_code, {})
-                        location_details.append({
-                            'code': location_code,
-                            'city': location_info.get('city', location_code),
-                            'country': location_info.get('country', 'Unknown'),
-                            'countryCode': location_info.get('countryCode', 'XX'),
-                            'region': location_info.get('region', 'Unknown')
-                        })
+                    location_details = self._get_location_details(location_map, locations_list)
                     
                     lb_data = {
                         'platform': 'cloud',
                         'type': 'cloud-loadbalancer',
-                        'instanceType': getattr(lb_type, 'name', ''),
+                        'instanceType': type_name,
                         'max_connections': getattr(lb_type, 'max_connections', 0),
                         'max_services': getattr(lb_type, 'max_services', 0),
                         'max_targets': getattr(lb_type, 'max_targets', 0),
@@ -372,7 +678,7 @@ class HetznerCloudCollector:
                         'deprecated': getattr(lb_type, 'deprecated', False),
                         'source': 'hetzner_cloud_api',
                         'description': getattr(lb_type, 'description', ''),
-                        'lastUpdated': datetime.now().isoformat(),
+                        'lastUpdated': last_updated,
                         'hetzner_metadata': {
                             'platform': 'cloud',
                             'apiSource': 'hcloud_library',
@@ -402,6 +708,41 @@ class HetznerCloudCollector:
         
         return []
     
+    def _get_shared_location_map(self) -> Dict[str, Dict[str, str]]:
+        """Fetch locations once per collector and reuse the mapping."""
+        with self._location_lock:
+            if self._location_map is None:
+                self._location_map = self._get_location_mapping(self.client.locations.get_all())
+            return self._location_map
+    
+    def _get_location_details(self, location_map: Dict[str, Dict[str, str]],
+                              location_codes: List[str]) -> List[Dict[str, str]]:
+        """Build locationDetails, sharing one dict per location across all rows."""
+        details = []
+        for location_code in location_codes:
+            entry = self._location_details.get(location_code)
+            if entry is None:
+                location_info = location_map.get(location_code, {})
+                entry = self._location_details.setdefault(location_code, {
+                    'code': location_code,
+                    'city': location_info.get('city', location_code),
+                    'country': location_info.get('country', 'Unknown'),
+                    'countryCode': location_info.get('countryCode', 'XX'),
+                    'region': location_info.get('region', 'Unknown')
+                })
+            details.append(entry)
+        return details
+    
+    def _get_price_index(self) -> Optional[Dict[str, Dict[str, Dict[str, Any]]]]:
+        """Fetch pricing and index it by type name once per collector."""
+        with self._price_index_lock:
+            if self._price_index is None:
+                pricing_data = fetch_pricing_data()
+                if pricing_data is None:
+                    return None
+                self._price_index = _build_price_index(pricing_data)
+            return self._price_index
+    
     def _get_location_mapping(self, locations: List[Any]) -> Dict[str, Dict[str, str]]:
         """Create mapping of location codes to detailed information."""
         location_map = {}
@@ -452,15 +793,21 @@ class HetznerDedicatedCollector:
         processed_servers = []
         
         try:
-            # Method 1: Try using Robot API directly with requests
-            # Server products endpoint (public, no auth required)
-            logger.info("Fetching server products from Robot API...")
-            processed_servers.extend(self._fetch_server_products())
-            
-            # Server market data (auction servers - requires auth)
-            if self.has_credentials:
-                logger.info("Fetching server market data from Robot API...")
-                processed_servers.extend(self._fetch_server_market_data())
+            with ThreadPoolExecutor(max_workers=MAX_FETCH_WORKERS) as executor:
+                # Method 1: Try using Robot API directly with requests
+                # Server products endpoint (public, no auth required)
+                logger.info("Fetching server products from Robot API...")
+                products = executor.submit(self._fetch_server_products)
+                
+                # Server market data (auction servers - requires auth)
+                market = None
+                if self.has_credentials:
+                    logger.info("Fetching server market data from Robot API...")
+                    market = executor.submit(self._fetch_server_market_data)
+                
+                processed_servers.extend(products.result())
+                if market is not None:
+                    processed_servers.extend(market.result())
             
             # Method 2: Web scrape regular dedicated servers from matrix page
             logger.info("Fetching regular dedicated servers from web...")
@@ -487,28 +834,24 @@ class HetznerDedicatedCollector:
         servers = []
         
         try:
-            import requests
-            from requests.auth import HTTPBasicAuth
-            
-            auth = HTTPBasicAuth(config.robot_user, config.robot_password)
+            auth = config.robot_auth
             
             # Robot API endpoint for server market
-            response = requests.get(
-                "https://robot-ws.your-server.de/order/server_market/product",
-                auth=auth,
-                headers={'Accept': 'application/json'},
-                timeout=30
-            )
-            
-            if response.status_code == 200:
-                data = response.json()
+            try:
+                data = fetch_json(f"{HETZNER_ROBOT_API_URL}/order/server_market/product", auth=auth)
+            except requests.HTTPError as e:
+                logger.warning(f"Server market API returned status {e.response.status_code}: {e.response.text}")
+                data = None
+            
+            if data is not None:
                 
                 # Debug: Log the actual API response structure
                 logger.info(f"Server market API response structure: {type(data)}")
                 if isinstance(data, dict):
                     logger.info(f"Response keys: {list(data.keys())}")
-                    if len(str(data)) < 1000:  # Only log if response is small
-                        logger.info(f"Sample response: {data}")
+                    # Rendering str(data) walks the whole response, so only do it for debug runs
+                    if logger.isEnabledFor(logging.DEBUG) and len(str(data)) < 1000:
+                        logger.debug(f"Sample response: {data}")
                 elif isinstance(data, list) and data:
                     logger.info(f"Response is list with {len(data)} items")
                     if data:
@@ -522,21 +865,21 @@ class HetznerDedicatedCollector:
                 elif isinstance(data, list):
                     # List of product responses
                     logger.info(f"Found list of {len(data)} products")
-                    for item in data:
-                        if isinstance(item, dict) and 'product' in item:
-                            servers.append(self._parse_server_market_product(item['product']))
-                        else:
-                            servers.append(self._parse_server_market_product(item))
+                    servers.extend(
+                        self._parse_server_market_product(
+                            item['product'] if isinstance(item, dict) and 'product' in item else item)
+                        for item in data
+                    )
                 elif isinstance(data, dict):
                     # Try other possible root keys or treat as direct product
                     for key in ['products', 'servers', 'data', 'items']:
                         if key in data and isinstance(data[key], list):
                             logger.info(f"Found data under key '{key}'")
-                            for product in data[key]:
-                                if isinstance(product, dict) and 'product' in product:
-                                    servers.append(self._parse_server_market_product(product['product']))
-                                else:
-                                    servers.append(self._parse_server_market_product(product))
+                            servers.extend(
+                                self._parse_server_market_product(
+                                    product['product'] if isinstance(product, dict) and 'product' in product else product)
+                                for product in data[key]
+                            )
                             break
                     else:
                         # Treat as direct product
@@ -545,9 +888,6 @@ class HetznerDedicatedCollector:
                         
                 logger.info(f"Fetched {len(servers)} server market products")
                 
-            else:
-                logger.warning(f"Server market API returned status {response.status_code}: {response.text}")
-                
         except Exception as e:
             logger.error(f"Error fetching server market data: {e}")
             
@@ -558,34 +898,28 @@ class HetznerDedicatedCollector:
         servers = []
         
         try:
-            import requests
-            from requests.auth import HTTPBasicAuth
-            
             # Try without authentication first (public endpoint)
-            headers = {'Accept': 'application/json'}
             auth = None
             
             # Use authentication if available
             if self.has_credentials:
-                auth = HTTPBasicAuth(config.robot_user, config.robot_password)
+                auth = config.robot_auth
             
             # Robot API endpoint for server products
-            response = requests.get(
-                "https://robot-ws.your-server.de/order/server/product", 
-                auth=auth,
-                headers=headers,
-                timeout=30
-            )
-            
-            if response.status_code == 200:
-                data = response.json()
+            try:
+                data = fetch_json(f"{HETZNER_ROBOT_API_URL}/order/server/product", auth=auth)
+            except requests.HTTPError as e:
+                logger.warning(f"Server products API returned status {e.response.status_code}: {e.response.text}")
+                data = None
+            
+            if data is not None:
                 
                 # Debug: Log the actual API response structure
                 logger.info(f"Server products API response structure: {type(data)}")
                 if isinstance(data, dict):
                     logger.info(f"Response keys: {list(data.keys())}")
-                    if len(str(data)) < 1000:  # Only log if response is small
-                        logger.info(f"Sample response: {data}")
+                    if logger.isEnabledFor(logging.DEBUG) and len(str(data)) < 1000:
+                        logger.debug(f"Sample response: {data}")
                 elif isinstance(data, list) and data:
                     logger.info(f"Response is list with {len(data)} items")
                     if data:
@@ -593,29 +927,23 @@ class HetznerDedicatedCollector:
                 
                 # Parse the server products response
                 if isinstance(data, dict) and 'products' in data:
-                    for product in data['products']:
-                        servers.append(self._parse_server_product(product))
+                    servers.extend(self._parse_server_product(product) for product in data['products'])
                 elif isinstance(data, dict):
                     # Try other possible root keys
                     for key in ['server', 'servers', 'data', 'items', 'product']:
                         if key in data and isinstance(data[key], list):
                             logger.info(f"Found data under key '{key}'")
-                            for product in data[key]:
-                                servers.append(self._parse_server_product(product))
+                            servers.extend(self._parse_server_product(product) for product in data[key])
                             break
                     else:
                         # If no known key found, try the direct dict as a product
                         logger.info("Treating response dict as single product")
                         servers.append(self._parse_server_product(data))
                 elif isinstance(data, list):
-                    for product in data:
-                        servers.append(self._parse_server_product(product))
+                    servers.extend(self._parse_server_product(product) for product in data)
                         
                 logger.info(f"Fetched {len(servers)} server products")
                 
-            else:
-                logger.warning(f"Server products API returned status {response.status_code}: {response.text}")
-                
         except Exception as e:
             logger.error(f"Error fetching server products: {e}")
             
@@ -729,12 +1057,12 @@ class HetznerDedicatedCollector:
     
     def _extract_storage_size_from_description(self, storage_desc: str) -> int:
         """Extract total storage size in GB from storage description."""
+        if not storage_desc:
+            return 1000  # Default to 1TB if nothing to parse
+        
         try:
-            import re
-            
             # Look for patterns like "2x 512 GB", "4x 16 TB", etc.
-            pattern = r'(\d+)x?\s*(\d+(?:\.\d+)?)\s*(TB|GB)'
-            matches = re.findall(pattern, storage_desc, re.IGNORECASE)
+            matches = _STORAGE_DESC_RE.findall(storage_desc)
             
             total_gb = 0
             for count, size, unit in matches:
@@ -755,14 +1083,17 @@ class HetznerDedicatedCollector:
     def _parse_server_market_product(self, product: Dict[str, Any]) -> Dict[str, Any]:
         """Parse a server market product into our standard format."""
         try:
-            # Debug: Log available fields
-            logger.debug(f"Parsing market product with keys: {list(product.keys())}")
-            if len(str(product)) < 1000:
-                logger.debug(f"Product data: {product}")
+            # Debug: Log available fields (only rendered when debug logging is on,
+            # since str(product) serialises the whole product for every row)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Parsing market product with keys: {list(product.keys())}")
+                if len(str(product)) < 1000:
+                    logger.debug(f"Product data: {product}")
             
             # Extract basic info based on actual API structure
             product_id = product.get('id', 'Unknown')
-            name = product.get('name', f'Server-{product_id}')
+            # Only format the fallback name when the product has none
+            name = product['name'] if 'name' in product else f'Server-{product_id}'
             
             # Extract pricing - Robot API provides both net and VAT prices
             price_monthly = float(product.get('price', 0))  # Net monthly price
@@ -798,14 +1129,7 @@ class HetznerDedicatedCollector:
             total_storage_gb = hdd_size * hdd_count if hdd_size > 0 else 1000
             
             # Determine disk type from hdd_text
-            disk_type = 'SSD'
-            if hdd_text:
-                if 'nvme' in hdd_text.lower():
-                    disk_type = 'NVMe SSD'
-                elif 'ssd' in hdd_text.lower():
-                    disk_type = 'SSD'
-                elif 'hdd' in hdd_text.lower() or 'sata' in hdd_text.lower():
-                    disk_type = 'HDD'
+            disk_type = self._classify_disk_type(hdd_text.lower()) if hdd_text else 'SSD'
             
             # Get datacenter location info
             city = self._get_datacenter_city(datacenter)
@@ -857,9 +1181,10 @@ class HetznerDedicatedCollector:
         """Parse a regular server product into our standard format."""
         try:
             # Debug: Log available fields
-            logger.debug(f"Parsing server product with keys: {list(product.keys())}")
-            if len(str(product)) < 500:
-                logger.debug(f"Product data: {product}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Parsing server product with keys: {list(product.keys())}")
+                if len(str(product)) < 500:
+                    logger.debug(f"Product data: {product}")
             
             # Extract basic info - try multiple possible field names
             name = (product.get('name') or 
@@ -942,7 +1267,11 @@ class HetznerDedicatedCollector:
             logger.error(f"Error parsing server product: {e}")
             return self._create_fallback_server_entry('product-unknown', 'Unknown Server Product')
     
-    def _extract_cpu_cores(self, cpu_info: str) -> int:
+    # Robot listings repeat the same CPU, RAM and datacenter strings across many
+    # products, so these pure parsers are memoized per distinct input
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def _extract_cpu_cores(cpu_info: str) -> int:
         """Extract number of CPU cores from CPU description."""
         if not cpu_info:
             return 4  # Default
@@ -950,16 +1279,8 @@ class HetznerDedicatedCollector:
         cpu_lower = cpu_info.lower()
         
         # Common patterns for core detection
-        core_patterns = [
-            r'(\d+)\s*cores?',
-            r'(\d+)\s*core',
-            r'(\d+)c/',
-            r'(\d+)c\s',
-        ]
-        
-        import re
-        for pattern in core_patterns:
-            match = re.search(pattern, cpu_lower)
+        for pattern in _CPU_CORE_PATTERNS:
+            match = pattern.search(cpu_lower)
             if match:
                 return int(match.group(1))
         
@@ -975,23 +1296,16 @@ class HetznerDedicatedCollector:
             
         return 4  # Default fallback
     
-    def _extract_ram_amount(self, ram_info: str) -> int:
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def _extract_ram_amount(ram_info: str) -> int:
         """Extract RAM amount in GB from RAM description."""
         if not ram_info:
             return 16  # Default
             
-        import re
-        
         # Look for patterns like "64 GB", "32GB", "128 GB DDR4"
-        patterns = [
-            r'(\d+)\s*GB',
-            r'(\d+)\s*gb',
-            r'(\d+)GB',
-            r'(\d+)gb'
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, ram_info)
+        for pattern in _RAM_PATTERNS:
+            match = pattern.search(ram_info)
             if match:
                 return int(match.group(1))
         
@@ -1002,50 +1316,35 @@ class HetznerDedicatedCollector:
         if not storage_info:
             return 1000, 'SSD'  # Default
             
-        import re
         storage_lower = storage_info.lower()
         
         # Extract size
         size_gb = 1000  # Default
-        size_patterns = [
-            r'(\d+)\s*tb',
-            r'(\d+)\s*gb',
-            r'(\d+)tb',
-            r'(\d+)gb'
-        ]
-        
-        for pattern in size_patterns:
-            match = re.search(pattern, storage_lower)
+        for literal, pattern, multiplier in _STORAGE_SIZE_PATTERNS:
+            if literal not in storage_lower:
+                continue
+            match = pattern.search(storage_lower)
             if match:
-                size = int(match.group(1))
-                if 'tb' in pattern:
-                    size_gb = size * 1000  # Convert TB to GB
-                else:
-                    size_gb = size
+                size_gb = int(match.group(1)) * multiplier  # TB patterns convert to GB
                 break
         
         # Extract type
-        disk_type = 'SSD'  # Default
-        if 'nvme' in storage_lower:
-            disk_type = 'NVMe SSD'
-        elif 'ssd' in storage_lower:
-            disk_type = 'SSD'
-        elif 'hdd' in storage_lower or 'sata' in storage_lower:
-            disk_type = 'HDD'
+        disk_type = self._classify_disk_type(storage_lower)
         
         return size_gb, disk_type
     
-    def _get_datacenter_city(self, datacenter_name: str) -> str:
+    def _classify_disk_type(self, storage_lower: str) -> str:
+        """Map lowercased storage text to a disk type, defaulting to SSD."""
+        for keyword, disk_type in _DISK_TYPE_KEYWORDS:
+            if keyword in storage_lower:
+                return disk_type
+        return 'SSD'
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=64)
+    def _get_datacenter_city(datacenter_name: str) -> str:
         """Get city name from datacenter code."""
-        datacenter_map = {
-            'FSN1': 'Falkenstein',
-            'NBG1': 'Nuremberg',
-            'HEL1': 'Helsinki',
-            'ASH': 'Ashburn',
-            'HIL': 'Hildesheim'
-        }
-        
-        for code, city in datacenter_map.items():
+        for code, city in _DATACENTER_CITIES:
             if code in datacenter_name:
                 return city
         
@@ -1191,37 +1490,44 @@ class HetznerDataCollector:
         
         all_data = []
         
-        # Collect cloud services
-        if self.cloud_collector:
-            try:
-                cloud_data = self.cloud_collector.collect_all_cloud_services()
-                all_data.extend(cloud_data)
-            except Exception as e:
-                logger.error(f"Cloud collection failed: {e}")
-        else:
-            if config.enable_cloud:
-                if not HCLOUD_AVAILABLE:
-                    logger.warning("🔇 Cloud services disabled - hcloud library not available")
-                elif not config.cloud_api_token:
-                    logger.warning("🔇 Cloud services disabled - HETZNER_API_TOKEN not provided")
+        # The Cloud and Robot APIs are independent, so dedicated services are collected
+        # in the background while cloud services are collected on this thread
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            dedicated_future = None
+            if self.dedicated_collector:
+                dedicated_future = executor.submit(self.dedicated_collector.collect_all_dedicated_services)
+            
+            # Collect cloud services
+            if self.cloud_collector:
+                try:
+                    cloud_data = self.cloud_collector.collect_all_cloud_services()
+                    all_data.extend(cloud_data)
+                except Exception as e:
+                    logger.error(f"Cloud collection failed: {e}")
             else:
-                logger.info("🔇 Cloud services disabled")
-        
-        # Collect dedicated services
-        if self.dedicated_collector:
-            try:
-                dedicated_data = self.dedicated_collector.collect_all_dedicated_services()
-                all_data.extend(dedicated_data)
-            except Exception as e:
-                logger.error(f"Dedicated collection failed: {e}")
-        else:
-            if config.enable_dedicated:
-                if not HETZNER_ROBOT_AVAILABLE:
-                    logger.warning("🔇 Dedicated services disabled - hetzner library not available")
+                if config.enable_cloud:
+                    if not HCLOUD_AVAILABLE:
+                        logger.warning("🔇 Cloud services disabled - hcloud library not available")
+                    elif not config.cloud_api_token:
+                        logger.warning("🔇 Cloud services disabled - HETZNER_API_TOKEN not provided")
                 else:
-                    logger.warning("🔇 Dedicated services disabled - collector initialization failed")
+                    logger.info("🔇 Cloud services disabled")
+            
+            # Collect dedicated services
+            if dedicated_future is not None:
+                try:
+                    dedicated_data = dedicated_future.result()
+                    all_data.extend(dedicated_data)
+                except Exception as e:
+                    logger.error(f"Dedicated collection failed: {e}")
             else:
-                logger.info("🔇 Dedicated services disabled")
+                if config.enable_dedicated:
+                    if not HETZNER_ROBOT_AVAILABLE:
+                        logger.warning("🔇 Dedicated services disabled - hetzner library not available")
+                    else:
+                        logger.warning("🔇 Dedicated services disabled - collector initialization failed")
+                else:
+                    logger.info("🔇 Dedicated services disabled")
         
         logger.info(f"📊 Total Hetzner services collected: {len(all_data)}")
         return all_data
@@ -1258,8 +1564,7 @@ def main():
             output_file = "data/providers/hetzner.json"
             os.makedirs(os.path.dirname(output_file), exist_ok=True)
             
-            with open(output_file, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            write_json(output_file, data)
             
             print(f"\n✅ SUCCESS: Saved {len(data)} total entries to {output_file}")
             
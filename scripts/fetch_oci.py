@@ -5,17 +5,33 @@ Fetches OCI compute instance pricing and specifications using public APIs and we
 """
 
 import os
+import re
 import sys
-import json
 import logging
 import requests
 from datetime import datetime
 from typing import Dict, List, Any, Optional
 
+from utils.json_io import parse_json, write_json
+
 # Set up logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Precompiled spec patterns matched against upper-cased instance names.
+# vCPU patterns carry a multiplier: 1 OCPU = 2 vCPU for x86
+_VCPU_PATTERNS = (
+    (re.compile(r'(\d+)\s*OCPU'), 2),
+    (re.compile(r'(\d+)\s*vCPU'), 1),
+    (re.compile(r'(\d+)\s*CPU'), 1),
+    (re.compile(r'(\d+)\s*Core'), 1),
+)
+_MEMORY_PATTERNS = tuple(re.compile(p) for p in (
+    r'(\d+)\s*GB',
+    r'(\d+)\s*GiB',
+    r'(\d+)GB',
+))
+
 class OCIDataCollector:
     """Collector for Oracle Cloud Infrastructure compute instances using public APIs."""
     
@@ -92,7 +108,7 @@ class OCIDataCollector:
             response = self.session.get(pricing_url, timeout=30)
             
             if response.status_code == 200:
-                data = response.json()
+                data = parse_json(response.content)
                 logger.info(f"Pricing API response structure: {type(data)}")
                 
                 # Parse pricing data for compute instances
@@ -126,9 +142,7 @@ class OCIDataCollector:
             # Create instances based on known OCI compute shapes
             shapes = self._get_known_compute_shapes()
             
-            for shape in shapes:
-                instance = self._create_instance_from_shape(shape)
-                instances.append(instance)
+            instances = [self._create_instance_from_shape(shape) for shape in shapes]
             
             logger.info(f"Created {len(instances)} instances from compute shapes")
             
@@ -191,41 +205,23 @@ class OCIDataCollector:
     
     def _extract_specs_from_name(self, name: str) -> Dict[str, int]:
         """Extract vCPU and memory specs from instance name."""
-        import re
-        
         # Default values
         vcpu = 1
         memory = 1
         
         # Look for patterns like "2 OCPU", "4 vCPU", "8 GB"
-        vcpu_patterns = [
-            r'(\d+)\s*OCPU',
-            r'(\d+)\s*vCPU',
-            r'(\d+)\s*CPU',
-            r'(\d+)\s*Core'
-        ]
-        
-        memory_patterns = [
-            r'(\d+)\s*GB',
-            r'(\d+)\s*GiB',
-            r'(\d+)GB'
-        ]
-        
         name_upper = name.upper()
         
         # Extract vCPU/OCPU
-        for pattern in vcpu_patterns:
-            match = re.search(pattern, name_upper)
+        for pattern, multiplier in _VCPU_PATTERNS:
+            match = pattern.search(name_upper)
             if match:
-                vcpu = int(match.group(1))
-                # Convert OCPU to vCPU (1 OCPU = 2 vCPU for x86)
-                if 'OCPU' in pattern:
-                    vcpu = vcpu * 2
+                vcpu = int(match.group(1)) * multiplier
                 break
         
         # Extract memory
-        for pattern in memory_patterns:
-            match = re.search(pattern, name_upper)
+        for pattern in _MEMORY_PATTERNS:
+            match = pattern.search(name_upper)
             if match:
                 memory = int(match.group(1))
                 break
@@ -370,13 +366,10 @@ class OCIDataCollector:
             {'name': 'VM.Standard.E2.8', 'ocpu': 8, 'memory': 64, 'price_hourly': 0.3264, 'arch': 'x86'},
         ]
         
-        instances = []
-        for shape in fallback_shapes:
-            instance = self._create_instance_from_shape(shape)
-            if instance:
-                instances.append(instance)
-        
-        return instances
+        return [
+            instance for shape in fallback_shapes
+            if (instance := self._create_instance_from_shape(shape))
+        ]
 
 def fetch_oci_data():
     """Main function for compatibility with existing orchestrator."""
@@ -396,8 +389,7 @@ def main():
             output_file = "data/oci.json"
             os.makedirs(os.path.dirname(output_file), exist_ok=True)
             
-            with open(output_file, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            write_json(output_file, data)
             
             print(f"\n✅ SUCCESS: Saved {len(data)} OCI instances to {output_file}")
             
@@ -6,7 +6,6 @@ Coordinates all cloud provider data fetching and processing.
 
 import os
 import sys
-import json
 import time
 import logging
 import asyncio
@@ -32,6 +31,7 @@ except ImportError:
 from utils.currency_converter import convert_currency
 from utils.data_validator import validate_instance_data
 from utils.data_normalizer import normalize_instance_data
+from utils.json_io import load_json, write_json
 
 # Configure logging
 logging.basicConfig(
@@ -46,6 +46,8 @@ OUTPUT_FILE = DATA_DIR / "all_instances.json"  # Keep for backward compatibility
 SUMMARY_FILE = DATA_DIR / "summary.json"
 PROVIDERS_DIR = DATA_DIR / "providers"
 MAX_WORKERS = 4
+# Attach the untouched provider record under 'raw' (debugging only; doubles output size)
+KEEP_RAW = os.environ.get('CPF_KEEP_RAW', 'false').lower() in ('1', 'true', 'yes')
 TIMEOUT_SECONDS = 300  # 5 minutes per provider
 
 # Provider Configuration - CENTRAL CONTROL FOR DATA FETCHING
@@ -100,8 +102,7 @@ class CloudDataOrchestrator:
         
         if provider_file.exists():
             try:
-                with open(provider_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
+                data = load_json(provider_file)
                 logger.info(f"✅ Loaded {len(data)} existing instances from {provider}")
                 return data
             except Exception as e:
@@ -153,7 +154,12 @@ class CloudDataOrchestrator:
         return []
     
     def _normalize_hetzner_data(self, data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        """Normalize Hetzner data to standard format."""
+        """Normalize Hetzner data to standard format.
+        
+        Inputs are consumed: v2-format items are updated in place and returned as the
+        normalized entries, and items that then fail validation are left modified.
+        Callers must not reuse the input dicts afterwards.
+        """
         normalized = []
         for item in data:
             try:
@@ -167,8 +173,10 @@ class CloudDataOrchestrator:
                     usd_hourly = eur_hourly * 1.1 if eur_hourly else 0
                     usd_monthly = eur_monthly * 1.1 if eur_monthly else 0
                     
-                    normalized_item = {
-                        **item,  # Keep all existing fields
+                    # Items come fresh from the fetcher and are not reused, so they are
+                    # extended in place instead of copied into a new dict
+                    normalized_item = item
+                    normalized_item.update({
                         'provider': 'hetzner',
                         'priceUSD_hourly': round(usd_hourly, 6),
                         'priceUSD_monthly': round(usd_monthly, 2),
@@ -178,7 +186,7 @@ class CloudDataOrchestrator:
                             'currency': 'EUR'
                         },
                         'regions': item.get('regions', item.get('locations', [])),
-                    }
+                    })
                 else:
                     # Legacy format (v1.0) - full normalization
                     eur_hourly = item.get('priceEUR_hourly_net', 0)
@@ -207,9 +215,10 @@ class CloudDataOrchestrator:
                         'deprecated': item.get('deprecated', False),
                         'source': item.get('source', 'hetzner_api'),
                         'description': item.get('description', ''),
-                        'lastUpdated': datetime.now().isoformat(),
-                        'raw': item
+                        'lastUpdated': datetime.now().isoformat()
                     }
+                    if KEEP_RAW:
+                        normalized_item['raw'] = item
                 
                 if validate_instance_data(normalized_item):
                     normalized.append(normalized_item)
@@ -299,24 +308,18 @@ class CloudDataOrchestrator:
                 'byType': {}
             }
         
-        # Calculate statistics
-        prices = [item['priceUSD_hourly'] for item in all_data if item['priceUSD_hourly'] > 0]
-        
-        # Group by provider
+        # Calculate statistics and group by provider and type in a single pass
+        prices = []
         by_provider = {}
-        for item in all_data:
-            provider = item['provider']
-            if provider not in by_provider:
-                by_provider[provider] = 0
-            by_provider[provider] += 1
-        
-        # Group by type
         by_type = {}
         for item in all_data:
+            price = item['priceUSD_hourly']
+            if price > 0:
+                prices.append(price)
+            provider = item['provider']
+            by_provider[provider] = by_provider.get(provider, 0) + 1
             item_type = item['type']
-            if item_type not in by_type:
-                by_type[item_type] = 0
-            by_type[item_type] += 1
+            by_type[item_type] = by_type.get(item_type, 0) + 1
         
         return {
             'totalInstances': len(all_data),
@@ -379,8 +382,7 @@ class CloudDataOrchestrator:
             for provider, data in self.results.items():
                 if data:  # Only save if we have data
                     provider_file = PROVIDERS_DIR / f"{provider}.json"
-                    with open(provider_file, 'w', encoding='utf-8') as f:
-                        json.dump(data, f, indent=2, ensure_ascii=False)
+                    write_json(provider_file, data)
                     provider_files[provider] = {
                         'file': f"providers/{provider}.json",
                         'count': len(data),
@@ -389,8 +391,7 @@ class CloudDataOrchestrator:
                     print(f"💾 Saved {len(data)} {provider} instances to {provider_file}")
             
             # Save combined data (backward compatibility)
-            with open(OUTPUT_FILE, 'w', encoding='utf-8') as f:
-                json.dump(all_data, f, indent=2, ensure_ascii=False)
+            write_json(OUTPUT_FILE, all_data)
             
             # Enhanced summary with provider file info
             summary['providerFiles'] = provider_files
@@ -401,8 +402,7 @@ class CloudDataOrchestrator:
             }
             
             # Save summary
-            with open(SUMMARY_FILE, 'w', encoding='utf-8') as f:
-                json.dump(summary, f, indent=2, ensure_ascii=False)
+            write_json(SUMMARY_FILE, summary)
             
             print(f"\n✅ SUCCESS: Saved {len(all_data)} instances to {OUTPUT_FILE}")
             print(f"✅ Summary saved to {SUMMARY_FILE}")
@@ -7,11 +7,15 @@ import requests
 import logging
 from typing import Dict, Optional
 from datetime import datetime, timedelta
-import json
 import os
 
+from .json_io import parse_json
+
 logger = logging.getLogger(__name__)
 
+# Shared session so rate refreshes reuse a pooled keep-alive connection
+_session = requests.Session()
+
 # Simple cache for exchange rates
 _rate_cache = {}
 _cache_expiry = None
@@ -42,13 +46,13 @@ def get_exchange_rates() -> Dict[str, float]:
     try:
         # Try to fetch from free API (exchangerate-api.com or similar)
         # Note: In production, use a paid service for better reliability
-        response = requests.get(
+        response = _session.get(
             "https://api.exchangerate-api.com/v4/latest/USD",
             timeout=10
         )
         
         if response.status_code == 200:
-            data = response.json()
+            data = parse_json(response.content)
             # Convert to rates TO USD (inverse of FROM USD)
             rates = {}
             for currency, rate in data.get('rates', {}).items():
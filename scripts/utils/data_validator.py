@@ -30,6 +30,12 @@ VALID_TYPES = [
     'dedicated-colocation'
 ]
 
+# Set views for O(1) membership checks in the per-instance hot path
+_REQUIRED_FIELDS_SET = frozenset(REQUIRED_FIELDS)
+_VALID_PROVIDERS_SET = frozenset(VALID_PROVIDERS)
+_VALID_TYPES_SET = frozenset(VALID_TYPES)
+_COMPUTE_TYPES_SET = frozenset(('cloud-server', 'dedicated-server', 'dedicated-auction'))
+
 def validate_instance_data(instance: Dict[str, Any]) -> bool:
     """
     Validate a single cloud instance data structure.
@@ -41,38 +47,40 @@ def validate_instance_data(instance: Dict[str, Any]) -> bool:
         bool: True if valid, False otherwise
     """
     try:
-        # Check required fields
-        for field in REQUIRED_FIELDS:
-            if field not in instance:
-                logger.error(f"Missing required field: {field}")
-                return False
+        # Check required fields (single subset test; only scan for the name on failure)
+        if not _REQUIRED_FIELDS_SET.issubset(instance):
+            field = next(f for f in REQUIRED_FIELDS if f not in instance)
+            logger.error(f"Missing required field: {field}")
+            return False
         
         # Validate provider
-        if instance['provider'] not in VALID_PROVIDERS:
+        if instance['provider'] not in _VALID_PROVIDERS_SET:
             logger.error(f"Invalid provider: {instance['provider']}")
             return False
         
         # Validate type
-        if instance['type'] not in VALID_TYPES:
+        if instance['type'] not in _VALID_TYPES_SET:
             logger.error(f"Invalid type: {instance['type']}")
             return False
         
-        # Validate numeric fields (optional for some service types)
-        if 'vCPU' in instance and instance['vCPU'] is not None:
-            if not isinstance(instance['vCPU'], (int, float)) or instance['vCPU'] <= 0:
-                logger.error(f"Invalid vCPU: {instance['vCPU']}")
+        # Validate numeric fields (optional for some service types); each field is read once
+        vcpu = instance.get('vCPU')
+        if vcpu is not None:
+            if not isinstance(vcpu, (int, float)) or vcpu <= 0:
+                logger.error(f"Invalid vCPU: {vcpu}")
                 return False
         
-        if 'memoryGiB' in instance and instance['memoryGiB'] is not None:
-            if not isinstance(instance['memoryGiB'], (int, float)) or instance['memoryGiB'] <= 0:
-                logger.error(f"Invalid memoryGiB: {instance['memoryGiB']}")
+        memory = instance.get('memoryGiB')
+        if memory is not None:
+            if not isinstance(memory, (int, float)) or memory <= 0:
+                logger.error(f"Invalid memoryGiB: {memory}")
                 return False
         
         # Check for meaningful pricing data (either USD or EUR pricing)
-        has_usd_pricing = (isinstance(instance.get('priceUSD_hourly'), (int, float)) and 
-                          instance['priceUSD_hourly'] > 0)
-        has_eur_pricing = (isinstance(instance.get('priceEUR_hourly_net'), (int, float)) and 
-                          instance['priceEUR_hourly_net'] > 0)
+        usd_hourly = instance['priceUSD_hourly']
+        eur_hourly = instance.get('priceEUR_hourly_net')
+        has_usd_pricing = isinstance(usd_hourly, (int, float)) and usd_hourly > 0
+        has_eur_pricing = isinstance(eur_hourly, (int, float)) and eur_hourly > 0
         
         if not has_usd_pricing and not has_eur_pricing:
             logger.error(f"No valid pricing data found for {instance.get('instanceType')}")
@@ -84,12 +92,12 @@ def validate_instance_data(instance: Dict[str, Any]) -> bool:
             return False
         
         # For compute instances, require basic specs
-        if instance['type'] in ['cloud-server', 'dedicated-server', 'dedicated-auction']:
-            if not instance.get('vCPU') or instance.get('vCPU', 0) <= 0:
-                logger.error(f"Compute instance missing valid vCPU: {instance.get('instanceType')}")
+        if instance['type'] in _COMPUTE_TYPES_SET:
+            if not vcpu or vcpu <= 0:
+                logger.error(f"Compute instance missing valid vCPU: {instance['instanceType']}")
                 return False
-            if not instance.get('memoryGiB') or instance.get('memoryGiB', 0) <= 0:
-                logger.error(f"Compute instance missing valid memory: {instance.get('instanceType')}")
+            if not memory or memory <= 0:
+                logger.error(f"Compute instance missing valid memory: {instance['instanceType']}")
                 return False
         
         return True
@@ -0,0 +1,54 @@
+"""
+JSON reading and writing utilities for CloudPriceFinder.
+Uses orjson when it is installed and falls back to the standard library.
+"""
+
+import json
+from pathlib import Path
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def parse_json(content: Union[bytes, str]) -> Any:
+    """
+    Decode a JSON document, e.g. an HTTP response body.
+
+    Args:
+        content: Raw JSON bytes or text
+
+    Returns:
+        The decoded object
+    """
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+def load_json(path: Union[str, Path]) -> Any:
+    """
+    Read and decode a JSON file.
+
+    Args:
+        path: File to read
+
+    Returns:
+        The decoded object
+    """
+    return parse_json(Path(path).read_bytes())
+
+def write_json(path: Union[str, Path], data: Any) -> None:
+    """
+    Write data to a file as indented UTF-8 JSON.
+
+    Args:
+        path: File to write
+        data: JSON-serializable object
+    """
+    if orjson is not None:
+        # orjson emits UTF-8 bytes directly, matching ensure_ascii=False
+        Path(path).write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+    else:
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)